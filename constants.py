@@ -7,3 +7,4 @@ not_doc_status = "Недокументированный статус домаш
 error_api_request = "Ошибка при запросе к API:"
 endpoint_is_not_available = "Эндпоинт недоступен. \nКод ответа API: "
 error_api_to_json = "Ошибка преобразования ответа API в JSON: "
+no_new_statuses = "Новых статусов нет."
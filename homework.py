@@ -1,14 +1,20 @@
 import os
 import logging
-from logging import StreamHandler
+from collections import OrderedDict, deque
 from http import HTTPStatus
+import random
 import time
 import sys
+from dataclasses import dataclass
+from typing import Optional
 
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from telebot import TeleBot
-from telebot.apihelper import ApiTelegramException
+from telebot.apihelper import ApiException
+from urllib3.util.retry import Retry
 
 from exceptions import ApiErrorException, NotAvailableEndPointException
 from constants import (
@@ -20,6 +26,7 @@ from constants import (
     error_api_request,
     endpoint_is_not_available,
     error_api_to_json,
+    no_new_statuses,
 )
 
 load_dotenv()
@@ -29,22 +36,116 @@ PRACTICUM_TOKEN = os.getenv("PRACTICUM_TOKEN")
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
-# Словарь для работы с токенами.
-TOKENS = {
-    "PRACTICUM_TOKEN": PRACTICUM_TOKEN,
-    "TELEGRAM_TOKEN": TELEGRAM_TOKEN,
-    "TELEGRAM_CHAT_ID": TELEGRAM_CHAT_ID,
-}
-
 # Время, через которое будет срабатывать бот (в секундах).
 RETRY_PERIOD = 600
 
+# Максимальная пауза между пустыми опросами (в секундах).
+MAX_RETRY_PERIOD = 3600
+
+# Предел показателя степени в 2**n при расчёте паузы. Пауза упирается в
+# MAX_RETRY_PERIOD раньше; предел лишь не даёт 2**n расти без ограничений.
+MAX_BACKOFF_EXPONENT = 8
+
+# Случайный разброс паузы между опросами (доля от паузы).
+RETRY_JITTER = 0.1
+
+# Период, в течение которого одинаковые сообщения об ошибках
+# не отправляются повторно (в секундах).
+RETRY_PERIOD_ERROR_TIME = 5000
+
 # ENDPOINT
 ENDPOINT = "https://practicum.yandex.ru/api/user_api/homework_statuses/"
 
 # Заголовки.
 HEADERS = {"Authorization": f"OAuth {PRACTICUM_TOKEN}"}
 
+# Таймауты запроса к API: (подключение, чтение) в секундах.
+API_TIMEOUT = (5, 30)
+
+# Предел паузы по заголовку Retry-After (в секундах): больший срок сервера
+# не должен останавливать цикл опроса внутри одного запроса.
+RETRY_AFTER_LIMIT = 60
+
+
+class CappedRetry(Retry):
+    """Retry, ограничивающий паузу из Retry-After до RETRY_AFTER_LIMIT."""
+
+    def get_retry_after(self, response):
+        """Пауза из Retry-After, не больше RETRY_AFTER_LIMIT."""
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        logger.warning(
+            "API просит повторить запрос через %s с, ждём %s с.",
+            retry_after,
+            min(retry_after, RETRY_AFTER_LIMIT),
+        )
+        return min(retry_after, RETRY_AFTER_LIMIT)
+
+
+# Сессия для запросов к API: соединение переиспользуется между опросами,
+# временные сбои повторяются внутри запроса с учётом Retry-After.
+# После исчерпания повторов возвращается последний ответ
+# (raise_on_status=False): raise_for_status() превращает его в HTTPError
+# с кодом ответа в тексте, а не в общий RetryError.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=CappedRetry(
+            total=5,
+            connect=3,
+            read=3,
+            status=3,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(("GET",)),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+@dataclass(slots=True)
+class ConditionalState:
+    """Валидаторы последнего ответа API для условного запроса."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def headers(self):
+        """Заголовки If-None-Match/If-Modified-Since для запроса."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def update(self, response):
+        """Запомнить валидаторы из ответа API."""
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    def reset(self):
+        """Забыть валидаторы, чтобы следующий запрос вернул данные."""
+        self.etag = None
+        self.last_modified = None
+
+
+# Валидаторы последнего успешного ответа API.
+API_STATE = ConditionalState()
+
+# Маркер ответа 304: данные на сервере не изменились.
+NOT_MODIFIED = object()
+
+# Обязательные ключи ответа API и домашней работы.
+_REQUIRED_RESPONSE_KEYS = frozenset(("homeworks", "current_date"))
+_REQUIRED_HW_KEYS = frozenset(("homework_name", "status"))
+
 # Вердикты.
 HOMEWORK_VERDICTS = {
     "approved": "Работа проверена: ревьюеру всё понравилось. Ура!",
@@ -52,83 +153,140 @@ HOMEWORK_VERDICTS = {
     "rejected": "Работа проверена: у ревьюера есть замечания.",
 }
 
+# Готовые шаблоны сообщений о смене статуса, по одному на вердикт.
+_VERDICT_TEMPLATES = {
+    status: f'Изменился статус проверки работы "%s". {verdict}'
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
 # Настройки логгирования.
 logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s [%(levelname)s] %(message)s"
+    level=logging.DEBUG,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    stream=sys.stdout,
 )
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-handler = StreamHandler()
-logger.addHandler(handler)
-formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
-handler.setFormatter(formatter)
 
-# Список выбрасываемых ошибок.
-error_messages = []
+# Максимальное число неотправленных сообщений об ошибках.
+ERROR_MESSAGES_LIMIT = 100
+
+# Сколько последних статусов домашних работ помнить в main().
+SEEN_HOMEWORKS_LIMIT = 1000
+
+# Очередь сообщений об ошибках, которые main() ещё не отправил.
+error_messages = deque(maxlen=ERROR_MESSAGES_LIMIT)
+
+# Время последней отправки сообщений об ошибках: текст -> timestamp.
+_SENT_CACHE = {}
+
+
+def _should_send(message, now):
+    """Проверить, что сообщение не отправлялось в течение периода."""
+    sent_at = _SENT_CACHE.get(message)
+    return sent_at is None or now - sent_at >= RETRY_PERIOD_ERROR_TIME
+
+
+def _remember_sent(message, now):
+    """Запомнить отправку сообщения и забыть устаревшие записи."""
+    for text, sent_at in list(_SENT_CACHE.items()):
+        if now - sent_at >= RETRY_PERIOD_ERROR_TIME:
+            del _SENT_CACHE[text]
+    _SENT_CACHE[message] = now
 
 
 def check_tokens():
-    """Функция проверки токенов."""
-    for name, value in TOKENS.items():
-        if not value:
-            logger.critical(
-                f'Отсутствует обязательная переменная окружения: "{name}".\n'
-                "Программа принудительно остановлена."
-            )
-            sys.exit(1)
-    if (
-        PRACTICUM_TOKEN is None
-        or TELEGRAM_CHAT_ID is None
-        or TELEGRAM_TOKEN is None
-    ):
+    """Функция проверки токенов.
+
+    Значения читаются из переменных модуля в момент вызова.
+    """
+    tokens = {
+        "PRACTICUM_TOKEN": PRACTICUM_TOKEN,
+        "TELEGRAM_TOKEN": TELEGRAM_TOKEN,
+        "TELEGRAM_CHAT_ID": TELEGRAM_CHAT_ID,
+    }
+    missing = [name for name, value in tokens.items() if not value]
+    if missing:
         logger.critical(
-            f'Отсутствует обязательная переменная окружения: "{name}".\n'
-            "Программа принудительно остановлена."
+            "Отсутствуют обязательные переменные окружения: %s.\n"
+            "Программа принудительно остановлена.",
+            ", ".join(missing),
         )
         sys.exit(1)
     return True
 
 
 def send_message(bot, message):
-    """Функция, отправляет пользователю сообщение."""
+    """Функция, отправляет пользователю сообщение.
+
+    При ошибке отправки возвращает False, повторную попытку делает
+    вызывающий код.
+    """
     try:
         bot.send_message(TELEGRAM_CHAT_ID, message)
         logger.debug(
-            f'Сообщение "{message}" успешно '
-            f"отправлено в чат {TELEGRAM_CHAT_ID}"
+            'Сообщение "%s" успешно отправлено в чат %s',
+            message,
+            TELEGRAM_CHAT_ID,
         )
         return True
-    except ApiTelegramException as error:
-        logger.error(f"Ошибка при отправке сообщения: {error}")
+    except (ApiException, requests.RequestException) as error:
+        logger.error("Ошибка при отправке сообщения: %s", error)
         return False
 
 
+def send_error_messages(bot):
+    """Отправить накопленные сообщения об ошибках.
+
+    Сообщение, уже отправленное в течение RETRY_PERIOD_ERROR_TIME,
+    пропускается. При ошибке отправки остаток очереди ждёт следующей
+    итерации.
+    """
+    while error_messages:
+        message = error_messages[0]
+        now = time.time()
+        if _should_send(message, now):
+            if not send_message(bot, message):
+                break
+            _remember_sent(message, now)
+        else:
+            logger.debug("Анти-спам обнаружение. Сообщение не отправлено.")
+        error_messages.popleft()
+
+
 def get_api_answer(timestamp):
-    """Функция-обработчик эндпоинта."""
+    """Функция-обработчик эндпоинта.
+
+    Возвращает NOT_MODIFIED, если API ответил 304.
+    """
     try:
-        response = requests.get(
-            ENDPOINT, headers=HEADERS, params={"from_date": timestamp}
+        response = SESSION.get(
+            ENDPOINT,
+            headers={**HEADERS, **API_STATE.headers()},
+            params={"from_date": timestamp},
+            timeout=API_TIMEOUT,
         )
         response.raise_for_status()
     except requests.RequestException as e:
         error_message = f"{error_api_request} {e}"
         logger.error(error_message)
-        error_messages.append(error_message)
         raise ApiErrorException(error_message)
 
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        return NOT_MODIFIED
+
     if response.status_code != HTTPStatus.OK:
         error_message = f"{endpoint_is_not_available}{response.status_code}"
         logger.error(error_message)
-        error_messages.append(error_message)
         raise NotAvailableEndPointException(error_message)
 
     try:
-        return response.json()
+        data = orjson.loads(response.content)
     except ValueError as e:
         error_message = f"{error_api_to_json}{e}"
         logger.error(error_message)
-        error_messages.append(error_message)
         raise ApiErrorException(error_message)
+    API_STATE.update(response)
+    return data
 
 
 def check_response(response):
@@ -136,37 +294,83 @@ def check_response(response):
     if not isinstance(response, dict):
         error_message = api_is_not_dict
         logger.error(error_message)
-        error_messages.append(error_message)
         raise TypeError(error_message)
-    if "homeworks" not in response or "current_date" not in response:
+    if not _REQUIRED_RESPONSE_KEYS.issubset(response):
         error_message = empty_api_keys
         logger.error(error_message)
-        error_messages.append(error_message)
         raise KeyError(error_message)
     if not isinstance(response["homeworks"], list):
         error_message = hmwrks_is_not_list
         logger.error(error_message)
-        error_messages.append(error_message)
         raise TypeError(error_message)
     return response
 
 
 def parse_status(homework):
     """Функция обновления статуса работы."""
-    if "homework_name" not in homework or "status" not in homework:
+    if not _REQUIRED_HW_KEYS.issubset(homework):
         error_message = empty_hmwrks_keys
         logger.error(error_message)
-        error_messages.append(error_message)
         raise KeyError(error_message)
     homework_name = homework["homework_name"]
     status = homework["status"]
-    if status not in HOMEWORK_VERDICTS:
+    template = _VERDICT_TEMPLATES.get(status)
+    if template is None:
         error_message = f"{not_doc_status} {status}"
         logger.error(error_message)
-        error_messages.append(error_message)
         raise ValueError(error_message)
-    verdict = HOMEWORK_VERDICTS[status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return template % (homework_name,)
+
+
+def _homework_key(homework):
+    """Ключ работы для учёта отправленных статусов."""
+    if not isinstance(homework, dict):
+        return None
+    return homework.get("id") or homework.get("homework_name")
+
+
+def _is_seen(seen, homework):
+    """Проверить, что о текущем статусе работы уже сообщалось.
+
+    Некорректная работа считается новой, её проверит parse_status.
+    """
+    key = _homework_key(homework)
+    if key is None or seen.get(key) != homework.get("status"):
+        return False
+    seen.move_to_end(key)
+    return True
+
+
+def _remember_status(seen, homework):
+    """Запомнить последний отправленный статус работы."""
+    key = _homework_key(homework)
+    seen[key] = homework["status"]
+    seen.move_to_end(key)
+    if len(seen) > SEEN_HOMEWORKS_LIMIT:
+        seen.popitem(last=False)
+
+
+def send_statuses(bot, homeworks, seen):
+    """Отправить сообщения о статусах, о которых ещё не сообщалось.
+
+    Возвращает False, если хотя бы одно сообщение не доставлено.
+    """
+    delivered = True
+    for homework in homeworks:
+        if _is_seen(seen, homework):
+            continue
+        if send_message(bot, parse_status(homework)):
+            _remember_status(seen, homework)
+        else:
+            delivered = False
+    return delivered
+
+
+def _retry_delay(idle_streak):
+    """Пауза до следующего опроса с учётом числа пустых опросов подряд."""
+    exponent = min(max(idle_streak - 1, 0), MAX_BACKOFF_EXPONENT)
+    delay = min(RETRY_PERIOD * 2**exponent, MAX_RETRY_PERIOD)
+    return delay * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER)
 
 
 def main():
@@ -176,23 +380,30 @@ def main():
 
     bot = TeleBot(token=TELEGRAM_TOKEN)
     timestamp = int(time.time())
-
-    last_error_message = None
-    last_error_time = 0
-    RETRY_PERIOD_ERROR_TIME = 5000  # В секундах.
+    idle_streak = 0
+    seen = OrderedDict()
+    debug = logger.debug
 
     while True:
         try:
             response = get_api_answer(timestamp)
-            logger.debug(f"Ответ от API: {response}")
+            if response is NOT_MODIFIED:
+                idle_streak += 1
+                debug(no_new_statuses)
+                continue
+            if logger.isEnabledFor(logging.DEBUG):
+                debug("Ответ от API: %s", response)
             response = check_response(response)
 
             if response["homeworks"]:
-                for homework in response["homeworks"]:
-                    message = parse_status(homework)
-                    send_message(bot, message)
+                idle_streak = 0
+                if not send_statuses(bot, response["homeworks"], seen):
+                    # Недоставленные статусы запросим снова с той же даты.
+                    API_STATE.reset()
+                    continue
             else:
-                logger.debug("Новых статусов нет.")
+                idle_streak += 1
+                debug(no_new_statuses)
 
             timestamp = response["current_date"]
 
@@ -200,32 +411,20 @@ def main():
             message = f"Сбой в работе программы: {error}"
             logger.error(message)
             error_messages.append(message)
-
-            current_time = time.time()
-            if (
-                message != last_error_message
-                or current_time - last_error_time > RETRY_PERIOD_ERROR_TIME
-            ):
-                if send_message(bot, message):
-                    last_error_message = message
-                    last_error_time = current_time
-                else:
-                    logger.debug(
-                        "Анти-спам обнаружение. Сообщение не отправлено."
-                    )
+            # Необработанный ответ нельзя подтверждать условным запросом.
+            API_STATE.reset()
         finally:
             try:
-                for error_message in error_messages:
-                    if send_message(bot, error_message):
-                        error_messages.remove(error_message)
-
+                send_error_messages(bot)
             except Exception as e:
                 logger.critical(
                     "Невозможно отправить сообщение об ошибке"
-                    f" пользователю: {e}."
+                    " пользователю: %s.",
+                    e,
                 )
 
-            time.sleep(RETRY_PERIOD)
+            delay = _retry_delay(idle_streak)
+            time.sleep(delay)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import json
 import logging
 import signal
 import re
@@ -89,6 +90,7 @@ class MockResponseGET:
         self.status_code = http_status
         self.reason = ""
         self.text = ""
+        self.headers = {}
         default_data = {"homeworks": [], "current_date": self.random_timestamp}
         self.data = data if data is not None else default_data
         logging.warn(MockResponseGET.CALLED_LOG_MSG)
@@ -96,6 +98,10 @@ class MockResponseGET:
     def json(self):
         return self.data
 
+    @property
+    def content(self):
+        return json.dumps(self.data).encode()
+
     def raise_for_status(self):
         if self.status_code >= 400:
             raise ValueError("Server or client error.")
@@ -185,7 +185,7 @@ class TestHomework:
                     "Проверьте, что в параметре `from_date` передано число."
                 )
 
-        monkeypatch.setattr(requests, "get", check_request_call)
+        monkeypatch.setattr(homework_module.SESSION, "get", check_request_call)
         try:
             homework_module.get_api_answer(current_timestamp)
         except AssertionError:
@@ -211,7 +211,7 @@ class TestHomework:
                 **kwargs,
             )
 
-        monkeypatch.setattr(requests, "get", mock_response_get)
+        monkeypatch.setattr(homework_module.SESSION, "get", mock_response_get)
 
         result = homework_module.get_api_answer(current_timestamp)
         assert isinstance(
@@ -229,7 +229,7 @@ class TestHomework:
             self.HOMEWORK_FUNC_WITH_PARAMS_QTY[func_name],
         )
 
-        monkeypatch.setattr(requests, "get", response)
+        monkeypatch.setattr(homework_module.SESSION, "get", response)
         try:
             homework_module.get_api_answer(current_timestamp)
         except Exception:
@@ -253,7 +253,9 @@ class TestHomework:
         def mock_request_get_with_exception(*args, **kwargs):
             raise requests.RequestException("Something wrong")
 
-        monkeypatch.setattr(requests, "get", mock_request_get_with_exception)
+        monkeypatch.setattr(
+            homework_module.SESSION, "get", mock_request_get_with_exception
+        )
         try:
             homework_module.get_api_answer(current_timestamp)
         except requests.RequestException as e:
@@ -265,6 +267,47 @@ class TestHomework:
         except Exception:
             pass
 
+    def test_get_api_answer_not_modified(
+        self, monkeypatch, random_timestamp, current_timestamp, homework_module
+    ):
+        sent_headers = {}
+
+        def mock_response_get(*args, **kwargs):
+            sent_headers.update(kwargs["headers"])
+            return check_utils.MockResponseGET(
+                *args,
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.NOT_MODIFIED,
+                **kwargs,
+            )
+
+        monkeypatch.setattr(homework_module.SESSION, "get", mock_response_get)
+        monkeypatch.setattr(
+            homework_module, "API_STATE", homework_module.ConditionalState("abc")
+        )
+
+        result = homework_module.get_api_answer(current_timestamp)
+        assert sent_headers.get("If-None-Match") == "abc", (
+            "Проверьте, что в запрос передаётся ETag предыдущего ответа."
+        )
+        assert result is homework_module.NOT_MODIFIED, (
+            "Проверьте, что при ответе 304 функция `get_api_answer` "
+            "возвращает `NOT_MODIFIED`."
+        )
+
+    def test_retry_after_is_capped(self, homework_module):
+        class MockRetryAfterResponse:
+            headers = {"Retry-After": "86400"}
+
+        retry = homework_module.SESSION.get_adapter(
+            homework_module.ENDPOINT
+        ).max_retries
+        assert isinstance(retry, homework_module.CappedRetry)
+        assert (
+            retry.new().get_retry_after(MockRetryAfterResponse())
+            == homework_module.RETRY_AFTER_LIMIT
+        ), "Проверьте, что пауза по заголовку `Retry-After` ограничена."
+
     def test_parse_status_with_expected_statuses(self, homework_module):
         func_name = "parse_status"
         check_utils.check_function(
@@ -464,6 +507,165 @@ class TestHomework:
                 "метод бота `send_message`."
             )
 
+    def test_send_error_messages_skips_duplicates(
+        self, monkeypatch, homework_module
+    ):
+        monkeypatch.setattr(homework_module, "TELEGRAM_CHAT_ID", "12345")
+        monkeypatch.setattr(homework_module, "_SENT_CACHE", {})
+        monkeypatch.setattr(
+            homework_module,
+            "error_messages",
+            homework_module.deque(["Duplicate_check", "Duplicate_check"]),
+        )
+        sent = []
+
+        class CountingBot(check_utils.MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                sent.append(text)
+
+        homework_module.send_error_messages(CountingBot())
+        assert sent == ["Duplicate_check"], (
+            "Убедитесь, что одинаковое сообщение об ошибке не отправляется "
+            "повторно в течение `RETRY_PERIOD_ERROR_TIME`."
+        )
+        assert not homework_module.error_messages, (
+            "Убедитесь, что очередь сообщений об ошибках очищается."
+        )
+
+    def test_send_error_messages_stops_on_failure(
+        self, monkeypatch, homework_module
+    ):
+        monkeypatch.setattr(homework_module, "TELEGRAM_CHAT_ID", "12345")
+        monkeypatch.setattr(homework_module, "_SENT_CACHE", {})
+        assert (
+            homework_module.error_messages.maxlen
+            == homework_module.ERROR_MESSAGES_LIMIT
+        ), "Убедитесь, что очередь ошибок ограничена `ERROR_MESSAGES_LIMIT`."
+        error_messages = homework_module.deque(
+            maxlen=homework_module.ERROR_MESSAGES_LIMIT
+        )
+        error_messages.extend(["first", "second", "third"])
+        monkeypatch.setattr(homework_module, "error_messages", error_messages)
+        sent = []
+
+        class FailingSecondBot(check_utils.MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                if text == "second":
+                    raise requests.ConnectionError("Network is unreachable")
+                sent.append(text)
+
+        homework_module.send_error_messages(FailingSecondBot())
+        assert sent == ["first"], (
+            "Убедитесь, что отправка очереди ошибок останавливается на "
+            "первом неотправленном сообщении."
+        )
+        assert list(error_messages) == ["second", "third"], (
+            "Убедитесь, что неотправленные сообщения остаются в очереди "
+            "в исходном порядке."
+        )
+
+        error_messages.extend(
+            str(i) for i in range(homework_module.ERROR_MESSAGES_LIMIT)
+        )
+        assert len(error_messages) == homework_module.ERROR_MESSAGES_LIMIT, (
+            "Убедитесь, что размер очереди ошибок ограничен "
+            "`ERROR_MESSAGES_LIMIT`."
+        )
+        assert error_messages[0] == "0", (
+            "Убедитесь, что при переполнении вытесняются самые старые "
+            "сообщения."
+        )
+
+    def test_send_message_with_network_error(
+        self, monkeypatch, caplog, homework_module
+    ):
+        monkeypatch.setattr(homework_module, "TELEGRAM_CHAT_ID", "12345")
+
+        class MockedBotWithNetworkError(check_utils.MockTelegramBot):
+            def send_message(self, *args, **kwargs):
+                raise requests.ConnectionError("Network is unreachable")
+
+        with check_utils.check_logging(
+            caplog,
+            level=logging.ERROR,
+            message=(
+                "Убедитесь, что сетевая ошибка при отправке сообщения в "
+                "Telegram логируется с уровнем `ERROR`."
+            ),
+        ):
+            result = homework_module.send_message(
+                MockedBotWithNetworkError(), "Network_error_check"
+            )
+        assert result is False, (
+            "Убедитесь, что при ошибке отправки функция `send_message` "
+            "возвращает `False`."
+        )
+
+    def test_retry_delay_backoff(self, homework_module):
+        for idle_streak, expected in ((0, 600), (1, 600), (2, 1200), (30, 3600)):
+            delay = homework_module._retry_delay(idle_streak)
+            assert expected * 0.9 <= delay <= expected * 1.1, (
+                "Проверьте, что пауза между пустыми опросами растёт "
+                "экспоненциально и не превышает `MAX_RETRY_PERIOD`."
+            )
+
+    def test_send_statuses_skips_seen(self, monkeypatch, homework_module):
+        monkeypatch.setattr(homework_module, "TELEGRAM_CHAT_ID", "12345")
+        sent = []
+
+        fail_next = []
+
+        class CountingBot(check_utils.MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                if fail_next:
+                    fail_next.pop()
+                    raise requests.ConnectionError("Network is unreachable")
+                sent.append(text)
+
+        bot = CountingBot()
+        seen = homework_module.OrderedDict()
+        homework = {"id": 1, "homework_name": "hw123", "status": "reviewing"}
+
+        fail_next.append(True)
+        assert not homework_module.send_statuses(bot, [homework], seen), (
+            "Убедитесь, что `send_statuses` сообщает о недоставленном статусе."
+        )
+        assert not seen, (
+            "Убедитесь, что недоставленный статус не запоминается."
+        )
+
+        homework_module.send_statuses(bot, [homework], seen)
+        homework_module.send_statuses(bot, [homework], seen)
+        assert len(sent) == 1, (
+            "Убедитесь, что об уже отправленном статусе работы "
+            "повторно не сообщается."
+        )
+        for status in ("rejected", "reviewing"):
+            homework_module.send_statuses(bot, [{**homework, "status": status}], seen)
+        assert len(sent) == 3 and sent[0] == sent[2], (
+            "Убедитесь, что о возврате работы к прежнему статусу "
+            "бот сообщает снова."
+        )
+        assert seen[1] == "reviewing", (
+            "Убедитесь, что запоминается последний отправленный статус."
+        )
+
+    def test_send_statuses_invalid_homework(self, homework_module):
+        try:
+            homework_module.send_statuses(
+                None, ["hw123"], homework_module.OrderedDict()
+            )
+        except KeyError as e:
+            assert e.args == (homework_module.empty_hmwrks_keys,), (
+                "Убедитесь, что для некорректной работы выбрасывается "
+                "исключение с понятным текстом."
+            )
+        else:
+            raise AssertionError(
+                "Убедитесь, что `send_statuses` выбрасывает исключение "
+                "для работы, не являющейся словарём."
+            )
+
     def test_bot_initialized_in_main(self, homework_module):
         func_name = "main"
         check_utils.check_function(
@@ -531,9 +733,9 @@ class TestHomework:
             if caller != "main":
                 old_sleep(secs)
                 return
-            assert secs == 600, (
+            assert 540 <= secs <= 660, (
                 "Убедитесь, что повторный запрос к API домашки отправляется "
-                "через 10 минут: `time.sleep(RETRY_PERIOD)`."
+                "через 10 минут (±10%): `time.sleep(delay)`."
             )
             raise check_utils.BreakInfiniteLoop("break")
 
@@ -563,7 +765,9 @@ class TestHomework:
                 data=response_data,
             )
         )
-        monkeypatch.setattr(requests, "get", mock_response_get_with_new_status)
+        monkeypatch.setattr(
+            homework_module.SESSION, "get", mock_response_get_with_new_status
+        )
         if platform.system() != "Windows":
             homework_module.main = check_utils.with_timeout(homework_module.main)
 
@@ -631,10 +835,151 @@ class TestHomework:
                     if record.message == (check_utils.MockResponseGET.CALLED_LOG_MSG)
                 ]
                 assert log_record, (
-                    "Убедитесь, что бот использует функцию `requests.get()` "
+                    "Убедитесь, что бот использует метод `SESSION.get()` "
                     "для отправки запроса к API домашки."
                 )
 
+    def test_main_not_modified_skips_check_response(
+        self,
+        monkeypatch,
+        random_timestamp,
+        current_timestamp,
+        random_message,
+        homework_module,
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module,
+        )
+        monkeypatch.setattr(
+            homework_module.SESSION,
+            "get",
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.NOT_MODIFIED,
+                data={},
+            ),
+        )
+
+        def mock_check_response(response=None):
+            raise SystemExit("check_response called")
+
+        monkeypatch.setattr(homework_module, "check_response", mock_check_response)
+        try:
+            homework_module.main()
+        except SystemExit as e:
+            raise AssertionError(
+                "Убедитесь, что при ответе 304 `main` не вызывает "
+                "`check_response`."
+            ) from e
+        except check_utils.BreakInfiniteLoop:
+            pass
+
+    def test_main_resets_validators_on_error(
+        self,
+        monkeypatch,
+        random_timestamp,
+        current_timestamp,
+        random_message,
+        homework_module,
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module,
+        )
+        state = homework_module.ConditionalState()
+        monkeypatch.setattr(homework_module, "API_STATE", state)
+
+        def mock_response_get(*args, **kwargs):
+            response = check_utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            response.headers = {"ETag": "abc"}
+            return response
+
+        monkeypatch.setattr(homework_module.SESSION, "get", mock_response_get)
+
+        def mock_check_response(response=None):
+            raise TypeError("broken response")
+
+        monkeypatch.setattr(homework_module, "check_response", mock_check_response)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        assert state.etag is None, (
+            "Убедитесь, что после ошибки обработки ответа валидаторы "
+            "условного запроса сбрасываются."
+        )
+
+    def test_main_retries_undelivered_status(
+        self,
+        monkeypatch,
+        random_timestamp,
+        current_timestamp,
+        random_message,
+        homework_module,
+        data_with_new_hw_status,
+    ):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module,
+            mock_bot=False,
+        )
+        from_dates = []
+
+        def mock_response_get(*args, **kwargs):
+            from_dates.append(kwargs["params"]["from_date"])
+            return check_utils.MockResponseGET(
+                *args,
+                random_timestamp=random_timestamp,
+                data={
+                    **data_with_new_hw_status,
+                    "current_date": 100 * len(from_dates),
+                },
+                **kwargs,
+            )
+
+        monkeypatch.setattr(homework_module.SESSION, "get", mock_response_get)
+        sent = []
+
+        class FailingOnceBot(check_utils.MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                if not from_dates[1:]:
+                    raise telebot.apihelper.ApiException(
+                        "Telegram недоступен.", "send_message", 500
+                    )
+                sent.append(text)
+
+        monkeypatch.setattr(homework_module, "TeleBot", FailingOnceBot)
+
+        def sleep_to_interrupt(secs):
+            if len(from_dates) >= 3:
+                raise check_utils.BreakInfiniteLoop("break")
+
+        monkeypatch.setattr(time, "sleep", sleep_to_interrupt)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+        assert from_dates[0] == from_dates[1], (
+            "Убедитесь, что при неудачной отправке статуса `main` повторяет "
+            "запрос с прежним `from_date`."
+        )
+        assert len(sent) == 1, (
+            "Убедитесь, что недоставленный статус отправляется на следующей "
+            "итерации и только один раз."
+        )
+
     def test_main_check_response_is_called(
         self,
         monkeypatch,